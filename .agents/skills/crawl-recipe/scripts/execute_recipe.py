@@ -8,15 +8,59 @@ according to the recipe's specifications.
 
 import argparse
 import csv
+import hashlib
 import json
 import re
+import shelve
+import string
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, BinaryIO, Generator, Iterable, Iterator, Optional, TextIO
 from urllib.parse import urljoin, urlparse
 
-from playwright.sync_api import sync_playwright, Page, Browser, Locator
+from playwright.sync_api import sync_playwright, Page, Browser, BrowserContext, Locator, Route
+from playwright.sync_api import Error as PlaywrightError, TimeoutError as PlaywrightTimeoutError
+
+try:
+    import orjson
+except ImportError:  # optional: fall back to the stdlib json module
+    orjson = None
+
+try:
+    from selectolax.lexbor import LexborHTMLParser as HTMLParser, SelectolaxError
+except ImportError:  # optional: fall back to per-field Playwright locators
+    HTMLParser = None
+
+
+_TAG_RE = re.compile(r'<[^>]+>')
+_NUM_RE = re.compile(r'-?\d+\.?\d*')
+
+# The page has already loaded by the time fields are read, so a missing
+# element should fail fast rather than wait out Playwright's default timeout
+_ACTION_TIMEOUT_MS = 500
+
+# Timeouts after which a field gives up on its remaining fallback selectors
+_MAX_FIELD_TIMEOUTS = 2
+
+# How long a paginated page may take to render its first field after load
+_READY_TIMEOUT_MS = 5000
+
+_FORMATTER = string.Formatter()
+
+# Resource types that only cost bandwidth when extracting text and attributes.
+# Stylesheets stay loaded since layout drives scrolling and click targets.
+_BLOCKED_RESOURCE_TYPES = frozenset({'image', 'font', 'media'})
+
+# Reads every matched element in a single round-trip for multiple-value fields
+# that Playwright has no bulk accessor for (text uses all_text_contents)
+_EXTRACT_ALL_JS = """(els, cfg) => els.map(e =>
+    cfg.type === 'html' ? e.innerHTML :
+    cfg.attribute ? e.getAttribute(cfg.attribute) : null
+)"""
 
 
 @dataclass
@@ -31,6 +75,15 @@ class TransformStep:
     pattern: Optional[str] = None
     replacement: Optional[str] = None
     default_value: Optional[str] = None
+    _compiled: Optional[re.Pattern] = field(default=None, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Compile user-supplied patterns once instead of on every value
+        if self.type in ('regex', 'replace') and self.pattern and self._compiled is None:
+            self._compiled = re.compile(self.pattern)
+            if self.type == 'replace':
+                # Surface bad group references now rather than mid-crawl
+                self._compiled.sub(self.replacement or '', '')
 
 
 @dataclass
@@ -43,6 +96,20 @@ class ExportField:
     multiple: bool = False
     fallback_selectors: list[str] = field(default_factory=list)
     list_container: Optional[str] = None
+    _fills_empty_after: list[bool] = field(default_factory=list, repr=False, compare=False)
+
+    def __post_init__(self):
+        # For each step, whether a later step can turn '' back into a value
+        # ('default', or a 'replace' whose pattern matches the empty string)
+        fills = False
+        flags = []
+        for t in reversed(self.transforms):
+            flags.append(fills)
+            if t.type == 'default':
+                fills = True
+            elif t.type == 'replace' and t._compiled is not None and t._compiled.search('') is not None:
+                fills = True
+        self._fills_empty_after = flags[::-1]
 
 
 @dataclass
@@ -52,6 +119,27 @@ class PaginationConfig:
     url_template: Optional[str] = None
     max_pages: int = 1
     wait_ms: int = 1000
+    _url_parts: tuple = field(default=(), repr=False, compare=False)
+
+    def __post_init__(self):
+        # Parse the template once instead of on every page
+        if self.url_template and not self._url_parts:
+            self._url_parts = tuple(_FORMATTER.parse(self.url_template))
+
+    def page_url(self, page_num: int) -> str:
+        """Build the URL for a page number from url_template."""
+        parts = []
+        for literal, field_name, format_spec, conversion in self._url_parts:
+            parts.append(literal)
+            if field_name is None:
+                continue
+            
+            # Resolves attribute/index lookups like {page.real} as str.format does
+            value, _ = _FORMATTER.get_field(field_name, (), {'page': page_num})
+            if conversion:
+                value = _FORMATTER.convert_field(value, conversion)
+            parts.append(format(value, format_spec))
+        return ''.join(parts)
 
 
 @dataclass
@@ -65,8 +153,8 @@ class CrawlRecipe:
 
 def parse_recipe(recipe_path: Path) -> CrawlRecipe:
     """Parse a recipe JSON file into a CrawlRecipe dataclass."""
-    with open(recipe_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    raw = recipe_path.read_bytes()
+    data = orjson.loads(raw) if orjson is not None else json.loads(raw)
     
     fields = []
     for f in data.get('fields', []):
@@ -115,16 +203,28 @@ def parse_recipe(recipe_path: Path) -> CrawlRecipe:
     )
 
 
+def json_dumps(obj: Any, indent: bool = False, sort_keys: bool = False) -> bytes:
+    """Serialize obj to UTF-8 JSON, using orjson when it is installed."""
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if indent else 0
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, option=option)
+    
+    return json.dumps(
+        obj, indent=2 if indent else None, sort_keys=sort_keys, ensure_ascii=False
+    ).encode('utf-8')
+
+
 def strip_html(html: str) -> str:
     """Remove HTML tags from a string."""
-    clean = re.sub(r'<[^>]+>', '', html)
-    return clean
+    return _TAG_RE.sub('', html)
 
 
 def extract_number(text: str) -> str:
     """Extract numeric value from text (keeps digits and decimal point)."""
     # Remove currency symbols and keep digits, decimal points, and minus signs
-    matches = re.findall(r'-?\d+\.?\d*', text.replace(',', ''))
+    matches = _NUM_RE.findall(text.replace(',', ''))
     if matches:
         # Return the first number found
         return matches[0]
@@ -152,16 +252,16 @@ def apply_transform(value: Any, transform: TransformStep) -> Any:
         return extract_number(value)
     
     elif transform.type == 'regex':
-        if transform.pattern:
-            match = re.search(transform.pattern, value)
+        if transform._compiled:
+            match = transform._compiled.search(value)
             if match:
                 return match.group(0) if match.groups() == () else match.group(1) if match.groups() else match.group(0)
         return ''
     
     elif transform.type == 'replace':
-        if transform.pattern:
+        if transform._compiled:
             replacement = transform.replacement or ''
-            return re.sub(transform.pattern, replacement, value)
+            return transform._compiled.sub(replacement, value)
         return value
     
     elif transform.type == 'default':
@@ -172,34 +272,68 @@ def apply_transform(value: Any, transform: TransformStep) -> Any:
     return value
 
 
-def apply_transforms(value: Any, transforms: list[TransformStep]) -> Any:
+def apply_transforms(
+    value: Any,
+    transforms: list[TransformStep],
+    fills_empty_after: Optional[list[bool]] = None
+) -> Any:
     """Apply multiple transforms in sequence."""
-    for transform in transforms:
+    for i, transform in enumerate(transforms):
         value = apply_transform(value, transform)
+        # Stop once the value is empty and no remaining step can refill it
+        if value == '' and fills_empty_after is not None and not fills_empty_after[i]:
+            break
     return value
 
 
-def extract_field_value(page: Page, field: ExportField) -> Any:
+def select_nodes(tree: Any, selector: str, selector_type: str) -> Optional[list[Any]]:
+    """Match a selector against the parsed page HTML.
+    
+    Returns None when the selector has to be resolved on the live page
+    instead: no parsed tree, a non-CSS selector, or Playwright-only syntax
+    such as :has-text() that selectolax can't parse.
+    """
+    if tree is None or selector_type != 'css':
+        return None
+    
+    try:
+        return tree.css(selector)
+    except SelectolaxError:
+        return None
+
+
+def extract_field_value(
+    page: Page,
+    field: ExportField,
+    tree: Any = None
+) -> Any:
     """Extract a single field value from the page."""
     # Try main selector first, then fallbacks
     selectors = [field.selector] + field.fallback_selectors
+    timeouts = 0
     
     for selector in selectors:
+        nodes = select_nodes(tree, selector, field.selector_type)
+        if not nodes:
+            # The snapshot can miss what the live DOM matches (open shadow
+            # roots, tables re-parsed with an inserted <tbody>), so a miss is
+            # re-checked on the page; this only costs a round-trip on misses
+            nodes = None
         try:
             if field.multiple:
                 # Extract multiple values
-                locators = page.locator(selector).all()
-                if not locators:
-                    continue
-                
-                values = []
-                for locator in locators:
-                    value = extract_from_locator(locator, field.extract)
-                    if value:
-                        values.append(value)
-                
+                if nodes is not None:
+                    values = [v for v in (extract_from_node(n, field.extract) for n in nodes) if v]
+                else:
+                    values = extract_all_from_locator(page.locator(selector), field.extract)
                 if values:
-                    transformed = apply_transforms(values, field.transforms)
+                    transformed = apply_transforms(values, field.transforms, field._fills_empty_after)
+                    return transformed
+            elif nodes is not None:
+                # Extract single value from the parsed page
+                value = extract_from_node(nodes[0], field.extract)
+                if value is not None:
+                    transformed = apply_transforms(value, field.transforms, field._fills_empty_after)
                     return transformed
             else:
                 # Extract single value
@@ -209,10 +343,16 @@ def extract_field_value(page: Page, field: ExportField) -> Any:
                 
                 value = extract_from_locator(locator, field.extract)
                 if value is not None:
-                    transformed = apply_transforms(value, field.transforms)
+                    transformed = apply_transforms(value, field.transforms, field._fills_empty_after)
                     return transformed
                     
-        except Exception:
+        except PlaywrightTimeoutError:
+            # A slow selector is likely to be slow again; stop probing fallbacks
+            timeouts += 1
+            if timeouts >= _MAX_FIELD_TIMEOUTS:
+                break
+        except PlaywrightError:
+            # Invalid selector or detached element: try the next fallback
             continue
     
     # Return None if no selector matched
@@ -221,32 +361,120 @@ def extract_field_value(page: Page, field: ExportField) -> Any:
 
 def extract_from_locator(locator: Locator, extract: ExtractConfig) -> Optional[str]:
     """Extract value from a locator based on extract config."""
-    try:
-        locator.wait_for(state='visible', timeout=5000)
-    except Exception:
-        pass
+    if extract.type == 'text':
+        return locator.text_content(timeout=_ACTION_TIMEOUT_MS) or ''
+    
+    elif extract.type == 'html':
+        return locator.inner_html(timeout=_ACTION_TIMEOUT_MS) or ''
     
+    elif extract.type == 'attribute':
+        if extract.attribute:
+            return locator.get_attribute(extract.attribute, timeout=_ACTION_TIMEOUT_MS) or ''
+    
+    return None
+
+
+def extract_from_node(node: Any, extract: ExtractConfig) -> Optional[str]:
+    """Extract value from a parsed HTML node based on extract config."""
     if extract.type == 'text':
-        return locator.text_content() or ''
+        return node.text() or ''
     
     elif extract.type == 'html':
-        return locator.inner_html() or ''
+        return node.inner_html or ''
     
     elif extract.type == 'attribute':
         if extract.attribute:
-            return locator.get_attribute(extract.attribute) or ''
+            return node.attributes.get(extract.attribute) or ''
     
     return None
 
 
+def extract_all_from_locator(locator: Locator, extract: ExtractConfig) -> list[str]:
+    """Extract non-empty values from every element matched by a locator."""
+    if extract.type == 'text':
+        return [v for v in locator.all_text_contents() if v]
+    
+    if extract.type not in ('html', 'attribute'):
+        return []
+    
+    values = locator.evaluate_all(
+        _EXTRACT_ALL_JS,
+        {'type': extract.type, 'attribute': extract.attribute}
+    )
+    return [v for v in values if v]
+
+
 def extract_data_from_page(page: Page, recipe: CrawlRecipe) -> dict[str, Any]:
     """Extract all fields from the current page."""
+    # Fetch the rendered HTML once so CSS fields are matched locally instead
+    # of costing a protocol round-trip per selector
+    tree = None
+    if HTMLParser is not None and any(f.selector_type == 'css' for f in recipe.fields):
+        try:
+            tree = HTMLParser(page.content())
+        except PlaywrightError:
+            pass  # e.g. page mid-navigation; fields use live locators instead
+    
     result = {}
     for field in recipe.fields:
-        result[field.field_name] = extract_field_value(page, field)
+        result[field.field_name] = extract_field_value(page, field, tree)
     return result
 
 
+def record_has_data(data: dict[str, Any]) -> bool:
+    """Return True if any field in an extracted record has a value."""
+    return any(v not in (None, '', []) for v in data.values())
+
+
+def record_digest(data: dict[str, Any]) -> bytes:
+    """Return a short content hash identifying an extracted record."""
+    return hashlib.blake2b(json_dumps(data, sort_keys=True), digest_size=8).digest()
+
+
+class ScrapeCache:
+    """Records extracted by earlier runs, keyed by recipe and URL.
+    
+    Entries are only reused while they are younger than ttl seconds and the
+    recipe is unchanged: the key covers both the recipe version and a hash
+    of the recipe file, so editing selectors doesn't serve stale records.
+    """
+    
+    def __init__(self, path: Path, recipe_key: str, ttl: int, force: bool = False):
+        self._db = shelve.open(str(path))
+        self._recipe_key = recipe_key
+        self._ttl = ttl
+        self._force = force
+        # shelve isn't thread-safe and url_pattern workers share one cache
+        self._lock = threading.Lock()
+    
+    def get(self, url: str) -> Optional[dict[str, Any]]:
+        """Return the cached record for url, or None if missing or expired."""
+        if self._force:
+            return None
+        
+        key = f'{self._recipe_key}:{url}'
+        with self._lock:
+            entry = self._db.get(key)
+            if entry is None:
+                return None
+            
+            saved_at, data = entry
+            if time.time() - saved_at > self._ttl:
+                # Drop stale entries so the file doesn't grow without bound
+                del self._db[key]
+                return None
+        return data
+    
+    def put(self, url: str, data: dict[str, Any]) -> None:
+        """Store the record extracted from url."""
+        with self._lock:
+            self._db[f'{self._recipe_key}:{url}'] = (time.time(), data)
+    
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+
 def handle_next_button_pagination(
     page: Page, 
     browser: Browser,
@@ -254,12 +482,11 @@ def handle_next_button_pagination(
     start_url: str,
     headless: bool,
     timeout: int
-) -> list[dict[str, Any]]:
+) -> Iterator[dict[str, Any]]:
     """Handle next button pagination."""
-    results = []
     pagination = recipe.pagination
     if not pagination:
-        return results
+        return
     
     current_page = 1
     
@@ -270,9 +497,8 @@ def handle_next_button_pagination(
         data = extract_data_from_page(page, recipe)
         
         # Check if we got any meaningful data
-        has_data = any(v for v in data.values() if v not in (None, '', []))
-        if has_data:
-            results.append(data)
+        if record_has_data(data):
+            yield data
         
         # Look for next button
         if pagination.selector:
@@ -298,8 +524,44 @@ def handle_next_button_pagination(
                 break
         else:
             break
+
+
+def scrape_url(
+    page: Page,
+    recipe: CrawlRecipe,
+    url: str,
+    timeout: int,
+    cache: Optional[ScrapeCache] = None
+) -> dict[str, Any]:
+    """Navigate to a URL and extract all fields from it."""
+    if cache is not None:
+        data = cache.get(url)
+        if data is not None:
+            print(f"  Using cached result for {url}", file=sys.stderr)
+            return data
+    
+    # Paginated pages share most assets, so wait for the first field to render
+    # instead of for the network to go idle
+    page.goto(url, wait_until='domcontentloaded', timeout=timeout * 1000)
+    if recipe.fields:
+        # Any of the first field's selectors counts, and extraction reads the
+        # DOM, so the element only needs to be attached, not visible
+        first = recipe.fields[0]
+        ready = page.locator(first.selector)
+        for selector in first.fallback_selectors:
+            ready = ready.or_(page.locator(selector))
+        try:
+            ready.first.wait_for(state='attached', timeout=_READY_TIMEOUT_MS)
+        except PlaywrightError:
+            pass  # empty page or bad selector; extraction below reports it
+    if recipe.pagination and recipe.pagination.wait_ms:
+        page.wait_for_timeout(recipe.pagination.wait_ms)
     
-    return results
+    data = extract_data_from_page(page, recipe)
+    # Empty pages aren't cached so the end of pagination is re-checked each run
+    if cache is not None and record_has_data(data):
+        cache.put(url, data)
+    return data
 
 
 def handle_url_pattern_pagination(
@@ -308,30 +570,36 @@ def handle_url_pattern_pagination(
     recipe: CrawlRecipe,
     start_url: str,
     headless: bool,
-    timeout: int
-) -> list[dict[str, Any]]:
+    timeout: int,
+    workers: int = 1,
+    block_resources: bool = True,
+    cache: Optional[ScrapeCache] = None
+) -> Iterator[dict[str, Any]]:
     """Handle URL pattern pagination."""
-    results = []
     pagination = recipe.pagination
     if not pagination or not pagination.url_template:
-        return results
+        return
+    
+    if workers > 1:
+        # Hand workers the cookies and storage picked up on the start URL so
+        # they see the same site state as the sequential path
+        yield from handle_url_pattern_pagination_parallel(
+            recipe, headless, timeout, workers, block_resources, cache,
+            page.context.storage_state()
+        )
+        return
     
     for page_num in range(1, pagination.max_pages + 1):
-        url = pagination.url_template.format(page=page_num)
+        url = pagination.page_url(page_num)
         print(f"  Scraping page {page_num}: {url}", file=sys.stderr)
         
         try:
-            page.goto(url, wait_until='networkidle', timeout=timeout * 1000)
-            if pagination.wait_ms:
-                page.wait_for_timeout(pagination.wait_ms)
-            
             # Extract data
-            data = extract_data_from_page(page, recipe)
+            data = scrape_url(page, recipe, url, timeout, cache)
             
             # Check if we got any meaningful data
-            has_data = any(v for v in data.values() if v not in (None, '', []))
-            if has_data:
-                results.append(data)
+            if record_has_data(data):
+                yield data
             else:
                 print(f"  No data found on page {page_num}, stopping.", file=sys.stderr)
                 break
@@ -339,8 +607,97 @@ def handle_url_pattern_pagination(
         except Exception as e:
             print(f"  Error loading page {page_num}: {e}", file=sys.stderr)
             break
+
+
+def handle_url_pattern_pagination_parallel(
+    recipe: CrawlRecipe,
+    headless: bool,
+    timeout: int,
+    workers: int,
+    block_resources: bool = True,
+    cache: Optional[ScrapeCache] = None,
+    storage_state: Optional[dict[str, Any]] = None
+) -> Iterator[dict[str, Any]]:
+    """Handle URL pattern pagination with several browsers fetching pages at once.
     
-    return results
+    Playwright's sync API is bound to the thread that started it, so each
+    worker runs its own Playwright instance and browser. Records are yielded
+    in page order, stopping at the first page that is empty or fails to load.
+    Workers never run more than `workers` pages ahead of the page being
+    yielded, so a slow page can't make finished ones pile up in memory.
+    """
+    pagination = recipe.pagination
+    scraped: dict[int, Optional[dict[str, Any]]] = {}
+    cond = threading.Condition()
+    stop_at = pagination.max_pages + 1
+    next_claim = 1
+    waiting_for = 1
+    active = workers
+    
+    def worker() -> None:
+        nonlocal stop_at, next_claim, active
+        try:
+            with sync_playwright() as p:
+                worker_browser = p.chromium.launch(headless=headless)
+                try:
+                    worker_page = new_context(
+                        worker_browser, block_resources, storage_state
+                    ).new_page()
+                    while True:
+                        with cond:
+                            cond.wait_for(
+                                lambda: next_claim < waiting_for + workers or next_claim > stop_at
+                            )
+                            if next_claim > min(stop_at, pagination.max_pages):
+                                return
+                            page_num = next_claim
+                            next_claim += 1
+                        
+                        url = pagination.page_url(page_num)
+                        print(f"  Scraping page {page_num}: {url}", file=sys.stderr)
+                        
+                        data = None
+                        try:
+                            data = scrape_url(worker_page, recipe, url, timeout, cache)
+                        except Exception as e:
+                            print(f"  Error loading page {page_num}: {e}", file=sys.stderr)
+                        
+                        with cond:
+                            if data is not None and not record_has_data(data):
+                                if page_num < stop_at:
+                                    print(f"  No data found on page {page_num}, stopping.", file=sys.stderr)
+                                data = None
+                            if data is None:
+                                stop_at = min(stop_at, page_num)
+                            scraped[page_num] = data
+                            cond.notify_all()
+                finally:
+                    worker_browser.close()
+        finally:
+            with cond:
+                active -= 1
+                cond.notify_all()
+    
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(worker) for _ in range(workers)]
+        try:
+            for page_num in range(1, pagination.max_pages + 1):
+                with cond:
+                    waiting_for = page_num
+                    cond.notify_all()
+                    cond.wait_for(lambda: page_num in scraped or active == 0)
+                    data = scraped.pop(page_num, None)
+                if data is None:
+                    break
+                yield data
+        finally:
+            # Let idle workers exit instead of fetching pages nobody will read
+            with cond:
+                stop_at = 0
+                cond.notify_all()
+        
+        for future in futures:
+            future.result()
 
 
 def handle_infinite_scroll_pagination(
@@ -350,16 +707,17 @@ def handle_infinite_scroll_pagination(
     start_url: str,
     headless: bool,
     timeout: int
-) -> list[dict[str, Any]]:
+) -> Iterator[dict[str, Any]]:
     """Handle infinite scroll pagination."""
-    results = []
     pagination = recipe.pagination
     if not pagination:
-        return results
+        return
     
     print(f"  Scraping with infinite scroll (max {pagination.max_pages} scrolls)...", file=sys.stderr)
     
     # Extract initial data
+    list_fields = [f.field_name for f in recipe.fields if f.multiple]
+    seen: set[bytes] = set()
     last_results_count = 0
     scroll_attempts = 0
     no_new_content_count = 0
@@ -370,34 +728,35 @@ def handle_infinite_scroll_pagination(
         current_data = extract_data_from_page(page, recipe)
         
         # Check if we got new content
-        has_data = any(v for v in current_data.values() if v not in (None, '', []))
+        has_data = record_has_data(current_data)
+        digest = record_digest(current_data) if has_data else None
+        is_new_snapshot = digest is not None and digest not in seen
         
-        # For lists, check if we got more items
-        is_list_field = any(f.multiple for f in recipe.fields)
-        if is_list_field and results:
-            # Compare list lengths to detect new content
-            for field in recipe.fields:
-                if field.multiple:
-                    current_list = current_data.get(field.field_name, [])
-                    if isinstance(current_list, list) and len(current_list) > last_results_count:
-                        no_new_content_count = 0
-                        break
+        # For lists, check if we got more items than on the previous scroll,
+        # or different ones: virtualized feeds recycle a fixed number of nodes
+        results_count = max(
+            (len(current_data.get(name) or []) for name in list_fields), default=0
+        )
+        if list_fields and seen:
+            if results_count > last_results_count or is_new_snapshot:
+                no_new_content_count = 0
             else:
                 no_new_content_count += 1
         elif has_data:
             no_new_content_count = 0
         else:
             no_new_content_count += 1
+        last_results_count = results_count
         
         if no_new_content_count >= max_no_new_content:
             print(f"  No new content after {max_no_new_content} scrolls, stopping.", file=sys.stderr)
             break
         
         # Save current data snapshot for comparison
-        if has_data:
-            # Only add if it's different from last
-            if not results or current_data != results[-1]:
-                results.append(current_data)
+        # Only add if this exact snapshot hasn't been emitted before
+        if is_new_snapshot:
+            seen.add(digest)
+            yield current_data
         
         # Scroll to bottom
         page.evaluate('window.scrollTo(0, document.body.scrollHeight)')
@@ -405,8 +764,81 @@ def handle_infinite_scroll_pagination(
         
         scroll_attempts += 1
         print(f"  Scroll {scroll_attempts}/{pagination.max_pages}", file=sys.stderr)
+
+
+def write_json_records(records: Iterable[dict[str, Any]], f: BinaryIO) -> int:
+    """Write records to f as a JSON array one at a time, returning the count."""
+    count = 0
+    try:
+        for record in records:
+            f.write(b'[\n' if count == 0 else b',\n')
+            f.write(b'  ' + json_dumps(record, indent=True).replace(b'\n', b'\n  '))
+            f.flush()
+            count += 1
+    finally:
+        # Close the array even if the crawl fails so partial output stays valid
+        f.write(b'\n]' if count else b'[]')
+    return count
+
+
+def _join_csv_list(value: Any) -> str:
+    """Flatten a multiple-value field into a single CSV cell."""
+    return '; '.join(map(str, value)) if value else ''
+
+
+def _csv_cell(value: Any) -> Any:
+    """Pass a single-value field through to the CSV cell unchanged."""
+    return value
+
+
+def write_csv_records(
+    records: Iterable[dict[str, Any]],
+    f: TextIO,
+    fields: list[ExportField]
+) -> int:
+    """Write records to f as CSV one at a time, returning the count."""
+    # Pick each column's list-to-string conversion once from the recipe
+    converters = {
+        fld.field_name: _join_csv_list if fld.multiple else _csv_cell
+        for fld in fields
+    }
     
-    return results
+    writer = None
+    count = 0
+    for row in records:
+        if writer is None:
+            writer = csv.DictWriter(f, fieldnames=row.keys())
+            writer.writeheader()
+        
+        writer.writerow({k: converters.get(k, _csv_cell)(v) for k, v in row.items()})
+        f.flush()
+        count += 1
+    return count
+
+
+def _block_heavy_resources(route: Route) -> None:
+    """Abort requests for resources that recipes never extract from."""
+    if route.request.resource_type in _BLOCKED_RESOURCE_TYPES:
+        route.abort()
+    else:
+        route.continue_()
+
+
+def new_context(
+    browser: Browser,
+    block_resources: bool = True,
+    storage_state: Optional[dict[str, Any]] = None
+) -> BrowserContext:
+    """Create a browser context with the crawler's viewport and user agent."""
+    context = browser.new_context(
+        viewport={'width': 1280, 'height': 800},
+        user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.0',
+        storage_state=storage_state
+    )
+    if block_resources:
+        # Routing disables Playwright's HTTP cache for this context
+        context.route('**/*', _block_heavy_resources)
+    return context
 
 
 def execute_recipe(
@@ -416,7 +848,11 @@ def execute_recipe(
     output_format: str,
     headless: bool,
     timeout: int,
-    additional_wait: int
+    additional_wait: int,
+    workers: int = 1,
+    block_resources: bool = True,
+    cache_ttl: int = 0,
+    force: bool = False
 ) -> None:
     """Execute a crawl recipe and save results."""
     
@@ -426,15 +862,20 @@ def execute_recipe(
     print(f"Recipe: {recipe.name}", file=sys.stderr)
     print(f"Fields: {len(recipe.fields)}", file=sys.stderr)
     
+    # Only url_pattern crawls visit addressable pages the cache can skip
+    cache = None
+    if cache_ttl > 0 and recipe.pagination and recipe.pagination.type == 'url_pattern':
+        cache_path = output_path.with_suffix('.cache')
+        recipe_hash = hashlib.blake2b(recipe_path.read_bytes(), digest_size=8).hexdigest()
+        print(f"Using scrape cache: {cache_path} (ttl={cache_ttl}s)", file=sys.stderr)
+        cache = ScrapeCache(cache_path, f'{recipe.version}:{recipe_hash}', cache_ttl, force)
+    
     # Launch browser
     print(f"Launching browser (headless={headless})...", file=sys.stderr)
     
     with sync_playwright() as p:
         browser = p.chromium.launch(headless=headless)
-        context = browser.new_context(
-            viewport={'width': 1280, 'height': 800},
-            user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.0'
-        )
+        context = new_context(browser, block_resources)
         page = context.new_page()
         
         try:
@@ -446,53 +887,47 @@ def execute_recipe(
                 print(f"Waiting additional {additional_wait}ms...", file=sys.stderr)
                 page.wait_for_timeout(additional_wait)
             
-            # Extract data based on pagination type
-            results = []
+            # Extract data based on pagination type; records are written as
+            # they are produced so a long crawl never holds every page in memory
+            records: Iterable[dict[str, Any]]
             
             if recipe.pagination:
                 if recipe.pagination.type == 'next_button':
-                    results = handle_next_button_pagination(
+                    records = handle_next_button_pagination(
                         page, browser, recipe, url, headless, timeout
                     )
                 elif recipe.pagination.type == 'url_pattern':
-                    results = handle_url_pattern_pagination(
-                        page, browser, recipe, url, headless, timeout
+                    records = handle_url_pattern_pagination(
+                        page, browser, recipe, url, headless, timeout, workers, block_resources,
+                        cache
                     )
                 elif recipe.pagination.type == 'infinite_scroll':
-                    results = handle_infinite_scroll_pagination(
+                    records = handle_infinite_scroll_pagination(
                         page, browser, recipe, url, headless, timeout
                     )
                 else:
                     # Single page
-                    data = extract_data_from_page(page, recipe)
-                    results = [data]
+                    records = [extract_data_from_page(page, recipe)]
             else:
                 # Single page extraction
-                data = extract_data_from_page(page, recipe)
-                results = [data]
-            
-            print(f"\nExtracted {len(results)} record(s)", file=sys.stderr)
+                records = [extract_data_from_page(page, recipe)]
             
             # Save results
-            if output_format == 'json':
-                with open(output_path, 'w', encoding='utf-8') as f:
-                    json.dump(results, f, indent=2, ensure_ascii=False)
-            else:
-                # CSV format
-                if results:
+            try:
+                if output_format == 'json':
+                    with open(output_path, 'wb') as f:
+                        count = write_json_records(records, f)
+                else:
+                    # CSV format
                     with open(output_path, 'w', newline='', encoding='utf-8') as f:
-                        writer = csv.DictWriter(f, fieldnames=results[0].keys())
-                        writer.writeheader()
-                        for row in results:
-                            # Convert lists to strings for CSV
-                            csv_row = {}
-                            for k, v in row.items():
-                                if isinstance(v, list):
-                                    csv_row[k] = '; '.join(str(x) for x in v)
-                                else:
-                                    csv_row[k] = v
-                            writer.writerow(csv_row)
+                        count = write_csv_records(records, f, recipe.fields)
+            finally:
+                # Close the pagination generator even if writing fails, so
+                # parallel url_pattern workers are told to stop and can exit
+                if isinstance(records, Generator):
+                    records.close()
             
+            print(f"\nExtracted {count} record(s)", file=sys.stderr)
             print(f"Results saved to: {output_path}", file=sys.stderr)
             
         except Exception as e:
@@ -500,6 +935,8 @@ def execute_recipe(
             raise
         finally:
             browser.close()
+            if cache is not None:
+                cache.close()
 
 
 def main():
@@ -544,8 +981,34 @@ def main():
         default=0,
         help='Additional wait time after page load in ms (default: 0)'
     )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=1,
+        help='Browsers fetching url_pattern pages in parallel (default: 1)'
+    )
+    parser.add_argument(
+        '--load-resources',
+        action='store_true',
+        help='Load images, fonts and media (blocked by default). Blocking routes '
+             'every request through the script, which disables the browser\'s '
+             'HTTP cache, so shared scripts are refetched on each page'
+    )
+    parser.add_argument(
+        '--cache-ttl',
+        type=int,
+        default=0,
+        help='Reuse url_pattern pages scraped within this many seconds (default: 0, disabled)'
+    )
+    parser.add_argument(
+        '--force',
+        action='store_true',
+        help='Re-scrape every page and refresh the cache (requires --cache-ttl)'
+    )
     
     args = parser.parse_args()
+    if args.force and args.cache_ttl <= 0:
+        parser.error('--force requires --cache-ttl')
     
     recipe_path = Path(args.recipe)
     if not recipe_path.exists():
@@ -562,7 +1025,11 @@ def main():
         output_format=args.format,
         headless=args.headless,
         timeout=args.timeout,
-        additional_wait=args.wait
+        additional_wait=args.wait,
+        workers=args.workers,
+        block_resources=not args.load_resources,
+        cache_ttl=args.cache_ttl,
+        force=args.force
     )
 
 